@@ -5,7 +5,7 @@ Downloads all available documents from GeoTracker sites within a specified
 geographic radius of a target location.
 
 Dependencies:
-pip install undetected-chromedriver selenium
+pip install undetected-chromedriver selenium numpy pandas requests
 
 Usage:
     python geotracker_downloader.py --lat 37.701 --lon -122.471 --radius .1
@@ -13,21 +13,70 @@ Usage:
 """
 
 import argparse
-import csv
-import glob
+import itertools
 import json
 import logging
 import math
+import multiprocessing.util
 import os
+import re
 import shutil
+import signal
 import sys
 import tempfile
 import time
 import zipfile
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait)
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
 
 EARTH_RADIUS_MILES = 3958.8
+# Slightly under the true ~69.09 so the bounding box errs on the wide side
+MILES_PER_DEGREE_LAT = 69.0
+# Bump when the layout written by _save_sites_cache changes
+SITES_CACHE_VERSION = 1
+# Extensions worth DEFLATE-ing in --zip-compression auto mode. Everything else
+# (PDFs, images, the bulk download's own .zip) is already compressed.
+COMPRESSIBLE_EXTENSIONS = {
+    '.txt', '.csv', '.tsv', '.xml', '.htm', '.html', '.json', '.rtf', '.doc', '.xls', '.dbf',
+}
+# Copy buffer for ZIP entries; zipfile.write() copies in 8 KB reads
+ZIP_COPY_BUFSIZE = 1 << 20
+# Minimum seconds between summary log checkpoints during a run
+SUMMARY_WRITE_INTERVAL = 10
+
+# Per-user state shared across runs and worker processes
+CACHE_DIR = Path.home() / '.cache' / 'geotracker'
+CLOUDFLARE_COOKIE_FILE = CACHE_DIR / 'cf_cookies.json'
+# Serializes undetected_chromedriver's patching of its shared driver binary
+CHROMEDRIVER_LOCK_FILE = CACHE_DIR / 'chromedriver.lock'
+# Persistent Chrome profiles, one per concurrent browser (Chrome locks a
+# profile to a single process). Browsers beyond MAX_CHROME_PROFILES, or that
+# find every slot busy, fall back to a throwaway temp profile.
+CHROME_PROFILE_DIR = CACHE_DIR / 'chrome'
+MAX_CHROME_PROFILES = 8
+# Default Chrome HTTP disk cache cap (--disk-cache-size). /dev/shm is only
+# used when it has room for several such caches, since containers often give
+# it just 64 MB.
+DEFAULT_DISK_CACHE_MB = 32
+DISK_CACHE_SHM_HEADROOM = 8
+# cf_clearance is typically honored for about 30 minutes
+CLOUDFLARE_COOKIE_MAX_AGE = 25 * 60
+
+# Marker for the bulk-download link in a site's document page HTML
+SELECT_ALL_PATTERN = re.compile(r'SELECT\s+ALL\s+DOCUMENTS', re.IGNORECASE)
+# Tab label proving the fetched HTML is a rendered site documents page
+DOCUMENTS_TAB_PATTERN = re.compile(r'SITE\s+MAPS\s*/\s*DOCUMENTS', re.IGNORECASE)
+
+# Concurrent HTTP downloads per site in the fallback document path
+HTTP_DOWNLOAD_WORKERS = 8
+HTTP_CHUNK_SIZE = 64 * 1024
 
 logger = logging.getLogger('geotracker')
 
@@ -50,41 +99,113 @@ def parse_sites_file(filepath):
     """
     Parse the TAB-delimited sites.txt file.
 
-    Returns a list of dicts with keys: global_id, business_name, latitude, longitude.
+    Returns (global_ids, business_names, lats, lons) as parallel NumPy arrays
+    (string ids/names, float64 coordinates). All four are ordered by ascending
+    latitude so radius queries can binary-search the latitude band.
     Rows with empty or unparseable coordinates are skipped.
+
+    The parsed arrays are cached in a {filepath}.npz sidecar, reused for as
+    long as it is newer than the TSV.
     """
-    sites = []
-    skipped = 0
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            try:
-                lat_str = row.get('LATITUDE', '').strip()
-                lon_str = row.get('LONGITUDE', '').strip()
-                if not lat_str or not lon_str:
-                    skipped += 1
-                    continue
-                lat = float(lat_str)
-                lon = float(lon_str)
-            except (ValueError, TypeError, KeyError):
-                skipped += 1
-                continue
-            sites.append({
-                'global_id': row['GLOBAL_ID'].strip(),
-                'business_name': row.get('BUSINESS_NAME', '').strip(),
-                'latitude': lat,
-                'longitude': lon,
-            })
-    logger.info(f"Parsed {len(sites)} sites with valid coordinates ({skipped} skipped)")
+    cache_path = filepath + '.npz'
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+            sites = _load_sites_cache(cache_path)
+            logger.info(f"Loaded {len(sites[2])} sites from cache {cache_path}")
+            return sites
+    except Exception as e:
+        if os.path.exists(cache_path):
+            logger.warning(f"Ignoring unreadable sites cache {cache_path}: {e}")
+
+    sites = _read_sites_tsv(filepath)
+    try:
+        _save_sites_cache(cache_path, *sites)
+        logger.debug(f"Wrote sites cache {cache_path}")
+    except OSError as e:
+        logger.warning(f"Could not write sites cache {cache_path}: {e}")
     return sites
 
 
+def _save_sites_cache(cache_path, global_ids, business_names, lats, lons):
+    """
+    Write parsed site arrays to an .npz sidecar, atomically.
+
+    Strings are stored as one NUL-joined UTF-8 buffer each so the cache
+    loads without pickle; _read_sites_tsv has already removed any NULs.
+    """
+    def pack(strings):
+        joined = '\0'.join(strings)
+        return np.frombuffer(joined.encode('utf-8'), dtype=np.uint8)
+
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, version=SITES_CACHE_VERSION, global_ids=pack(global_ids),
+                 business_names=pack(business_names), lats=lats, lons=lons)
+    os.replace(tmp_path, cache_path)
+
+
+def _load_sites_cache(cache_path):
+    """Load arrays written by _save_sites_cache. Raises ValueError if stale."""
+    def unpack(buf, count):
+        values = buf.tobytes().decode('utf-8').split('\0') if count else []
+        return np.array(values, dtype=object)
+
+    with np.load(cache_path, allow_pickle=False) as data:
+        if int(data['version']) != SITES_CACHE_VERSION:
+            raise ValueError("cache format version mismatch")
+        lats = data['lats']
+        lons = data['lons']
+        global_ids = unpack(data['global_ids'], len(lats))
+        business_names = unpack(data['business_names'], len(lats))
+    if not (len(global_ids) == len(business_names) == len(lats) == len(lons)):
+        raise ValueError("cache arrays have mismatched lengths")
+    return global_ids, business_names, lats, lons
+
+
+def _read_sites_tsv(filepath):
+    """Parse sites.txt itself. See parse_sites_file for the return value."""
+    df = pd.read_csv(
+        filepath,
+        sep='\t',
+        usecols=['GLOBAL_ID', 'BUSINESS_NAME', 'LATITUDE', 'LONGITUDE'],
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8',
+        encoding_errors='replace',
+    )
+    total = len(df)
+
+    # Blank or unparseable coordinates become NaN and are dropped below;
+    # to_numeric already ignores surrounding whitespace
+    coord_cols = ['LATITUDE', 'LONGITUDE']
+    df[coord_cols] = df[coord_cols].apply(pd.to_numeric, errors='coerce')
+    df = df.dropna(subset=coord_cols)
+    df = df.sort_values('LATITUDE', kind='stable')
+
+    # Clean both text columns in one vectorized pass. NULs are dropped so the
+    # sites cache can use them as separators.
+    text_cols = ['GLOBAL_ID', 'BUSINESS_NAME']
+    df[text_cols] = df[text_cols].fillna('').apply(
+        lambda col: col.str.replace('\0', '', regex=False).str.strip())
+
+    global_ids = df['GLOBAL_ID'].to_numpy(dtype=object)
+    business_names = df['BUSINESS_NAME'].to_numpy(dtype=object)
+    lats = df['LATITUDE'].to_numpy(dtype=np.float64)
+    lons = df['LONGITUDE'].to_numpy(dtype=np.float64)
+
+    logger.info(f"Parsed {len(lats)} sites with valid coordinates ({total - len(lats)} skipped)")
+    return global_ids, business_names, lats, lons
+
+
 def haversine_distance(lat1, lon1, lat2, lon2):
     """
     Calculate the great-circle distance between two points on Earth
     using the Haversine formula.
 
     Parameters are in decimal degrees. Returns distance in miles.
+
+    For one center against many points use haversine_distances, which
+    converts and takes the cosine of the center only once per call.
     """
     lat1_r, lon1_r = math.radians(lat1), math.radians(lon1)
     lat2_r, lon2_r = math.radians(lat2), math.radians(lon2)
@@ -94,46 +215,247 @@ def haversine_distance(lat1, lon1, lat2, lon2):
 
     a = (math.sin(dlat / 2) ** 2 +
          math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # asin form is equivalent to atan2(sqrt(a), sqrt(1 - a)) with one fewer
+    # sqrt; it only loses precision for near-antipodal points.
+    c = 2 * math.asin(math.sqrt(a))
 
     return EARTH_RADIUS_MILES * c
 
 
-def filter_sites_by_radius(sites, center_lat, center_lon, radius_miles):
+def haversine_distances(center_lat, center_lon, lats, lons):
+    """
+    Vectorized Haversine distance from one center point to arrays of points.
+
+    Parameters are in decimal degrees. Returns a float64 array of miles.
+
+    Center-point trig is computed once, and the per-point work reuses three
+    scratch arrays in place rather than allocating a temporary per operation.
+    """
+    center_lat_r = math.radians(center_lat)
+    center_lon_r = math.radians(center_lon)
+    lat_r = np.radians(np.atleast_1d(lats), dtype=np.float64)
+    lon_r = np.radians(np.atleast_1d(lons), dtype=np.float64)
+
+    # sin^2(dlat / 2)
+    a = lat_r - center_lat_r
+    a *= 0.5
+    np.sin(a, out=a)
+    a *= a
+
+    # cos(lat1) * cos(lat2) * sin^2(dlon / 2), reusing lon_r and lat_r
+    lon_r -= center_lon_r
+    lon_r *= 0.5
+    np.sin(lon_r, out=lon_r)
+    lon_r *= lon_r
+    np.cos(lat_r, out=lat_r)
+    lat_r *= math.cos(center_lat_r)
+    lon_r *= lat_r
+    a += lon_r
+
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * EARTH_RADIUS_MILES
+    return a
+
+
+def bounding_box_deltas(center_lat, radius_miles):
+    """
+    Return (lat_delta, lon_delta) in degrees for a box that fully contains
+    the circle of radius_miles around a point at center_lat.
+
+    The longitude span is sized at the box's poleward edge, where degrees of
+    longitude are shortest. Near the poles it covers all longitudes.
+    """
+    lat_delta = radius_miles / MILES_PER_DEGREE_LAT
+    edge_lat = abs(center_lat) + lat_delta
+    if edge_lat >= 90:
+        return lat_delta, 180.0
+    lon_delta = radius_miles / (MILES_PER_DEGREE_LAT * math.cos(math.radians(edge_lat)))
+    return lat_delta, min(lon_delta, 180.0)
+
+
+def filter_sites_by_radius(global_ids, business_names, lats, lons,
+                           center_lat, center_lon, radius_miles):
     """
     Filter sites to those within radius_miles of (center_lat, center_lon).
-    Returns sites sorted by distance (nearest first), each with a distance_miles key.
+
+    Takes the parallel arrays returned by parse_sites_file; lats must be
+    sorted ascending. Returns a list of dicts (global_id, business_name,
+    latitude, longitude, distance_miles) sorted by distance, nearest first.
+
+    The latitude band is located by binary search and narrowed with a cheap
+    longitude test, so the Haversine trig only touches the handful of
+    candidates near the center: O(log N + k) rather than a full scan.
     """
+    lat_delta, lon_delta = bounding_box_deltas(center_lat, radius_miles)
+    lo = np.searchsorted(lats, center_lat - lat_delta, side='left')
+    hi = np.searchsorted(lats, center_lat + lat_delta, side='right')
+    candidates = np.arange(lo, hi)
+    if lon_delta < 180:
+        # Wrap longitude differences into [-180, 180) to handle the antimeridian
+        dlon = (lons[candidates] - center_lon + 180) % 360 - 180
+        candidates = candidates[np.abs(dlon) <= lon_delta]
+
+    distances = haversine_distances(center_lat, center_lon,
+                                    lats[candidates], lons[candidates])
+    within = distances <= radius_miles
+    indices = candidates[within]
+    distances = distances[within]
+    order = np.argsort(distances, kind='stable')
+
     nearby = []
-    for site in sites:
-        dist = haversine_distance(center_lat, center_lon,
-                                  site['latitude'], site['longitude'])
-        if dist <= radius_miles:
-            site_copy = site.copy()
-            site_copy['distance_miles'] = round(dist, 3)
-            nearby.append(site_copy)
-
-    nearby.sort(key=lambda s: s['distance_miles'])
+    for idx, dist in zip(indices[order], distances[order]):
+        nearby.append({
+            'global_id': str(global_ids[idx]),
+            'business_name': str(business_names[idx]),
+            'latitude': float(lats[idx]),
+            'longitude': float(lons[idx]),
+            'distance_miles': round(float(dist), 3),
+        })
+
     logger.info(f"Found {len(nearby)} sites within {radius_miles} miles")
     return nearby
 
 
+def _try_lock_file(path, blocking=False):
+    """
+    Take an exclusive lock on path (created if missing).
+    Returns the open file, which holds the lock until closed, or None if
+    another process already holds it. With blocking=True, waits for the
+    lock instead of returning None.
+    """
+    f = open(path, 'a')
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if not blocking:
+                        raise
+                    time.sleep(0.5)
+        else:
+            import fcntl
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(f.fileno(), flags)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+def _is_cloudflare_cookie(name):
+    """True for Cloudflare's own cookies (cf_clearance, __cf_bm, ...)."""
+    return name.startswith('cf_') or name.startswith('__cf')
+
+
+def _cookie_value(cookies, name):
+    """Value of the named cookie in a Selenium cookie list, or None."""
+    for cookie in cookies:
+        if cookie.get('name') == name:
+            return cookie.get('value')
+    return None
+
+
+def _load_cloudflare_cookies():
+    """Read the saved Cloudflare cookie payload, or None if missing or corrupt."""
+    try:
+        with open(CLOUDFLARE_COOKIE_FILE) as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def scan_download_dir(download_dir):
+    """
+    Classify a download directory in a single os.scandir pass.
+
+    Returns (completed, pending): the names of finished files, and whether
+    any Chrome .crdownload partial files are still present.
+    """
+    completed = []
+    pending = False
+    with os.scandir(download_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.crdownload'):
+                pending = True
+            elif entry.is_file():
+                completed.append(entry.name)
+    return completed, pending
+
+
 class GeoTrackerDownloader:
     """Manages Selenium browser and document download workflow."""
 
     DOWNLOAD_URL = "https://geotracker.waterboards.ca.gov/profile_report?global_id={}&mytab=sitedocuments&zipdownload=True"
     HOME_URL = "https://geotracker.waterboards.ca.gov/"
 
-    def __init__(self, output_dir, delay, timeout, headless, resume, chrome_version=None):
+    # Evaluated in the page so each poll is one small round-trip instead of
+    # serializing and scanning the whole DOM in Python.
+    CLOUDFLARE_PROBE_JS = """
+        if (document.readyState !== 'complete') return true;
+        if (document.querySelector('#challenge-platform, #cf-browser-verification, '
+                                   + '[name="cf-chl"], script[src*="challenge-platform"]')) {
+            return true;
+        }
+        return /just a moment|checking your browser/i.test(document.title);
+    """
+
+    # Bulk-download controls, in order of preference. translate() upper-cases
+    # the text so the match does not depend on the page's capitalization.
+    SELECT_ALL_XPATHS = [
+        "//a[contains(translate(normalize-space(.), 'abcdefghijklmnopqrstuvwxyz', "
+        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), 'SELECT ALL DOCUMENTS')]",
+        "//*[contains(translate(text(), 'abcdefghijklmnopqrstuvwxyz', "
+        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), 'SELECT ALL DOCUMENTS')]",
+    ]
+    DOWNLOAD_SELECTED_XPATHS = [
+        "//input[@type='button' and @value='Download Selected Files']",
+        "//input[contains(@value, 'Download Selected')]",
+        "//button[contains(., 'Download Selected')]",
+        "//*[contains(text(), 'Download Selected Files')]",
+    ]
+    # Clicks the first element matching any XPath in arguments[0] and returns
+    # that XPath, or null if none matched
+    CLICK_FIRST_MATCH_JS = """
+        var xpaths = arguments[0];
+        for (var i = 0; i < xpaths.length; i++) {
+            var el = document.evaluate(xpaths[i], document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (el) {
+                el.click();
+                return xpaths[i];
+            }
+        }
+        return null;
+    """
+
+    def __init__(self, output_dir, delay, timeout, headless, resume, chrome_version=None,
+                 zip_compression='auto', disk_cache_mb=DEFAULT_DISK_CACHE_MB):
         self.output_dir = Path(output_dir)
         self.delay = delay
         self.timeout = timeout
         self.headless = headless
         self.resume = resume
         self.chrome_version = chrome_version
+        self.zip_compression = zip_compression
+        self.disk_cache_mb = disk_cache_mb
+        self.disk_cache_bytes = int(disk_cache_mb * 1024 * 1024)
+        self.profile_dir = None
+        self._profile_lock = None
+        self._temp_profile_dir = None
         self.driver = None
+        self.http = None
+        self._http_precheck_trusted = False
         self.base_temp_dir = None
+        self.existing_zips = set()
         self.results = []
+        self.log_path = None
+        self._last_summary_write = 0.0
         self.center_lat = None
         self.center_lon = None
         self.radius_miles = None
@@ -154,24 +476,99 @@ class GeoTrackerDownloader:
             'download.prompt_for_download': False,
             'download.directory_upgrade': True,
             'plugins.always_open_pdf_externally': True,
+            # Only the document links matter; skip rendering assets
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.default_content_setting_values.notifications': 2,
         }
         options.add_experimental_option('prefs', prefs)
+        options.add_argument('--blink-settings=imagesEnabled=false')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
         options.add_argument('--window-size=1920,1080')
 
-        chrome_kwargs = {'options': options}
+        # Reuse a persistent profile so cookies and cached static assets
+        # survive across runs; downloads still go to the temp dirs above
+        if self.profile_dir is None:
+            self._acquire_profile()
+        options.add_argument(f'--disk-cache-dir={self._disk_cache_dir()}')
+        options.add_argument(f'--disk-cache-size={self.disk_cache_bytes}')
+
+        chrome_kwargs = {'options': options, 'user_data_dir': self.profile_dir}
         if self.chrome_version:
             chrome_kwargs['version_main'] = self.chrome_version
             logger.info(f"Using specified Chrome version: {self.chrome_version}")
         else:
             logger.info("Auto-detecting Chrome version")
-        self.driver = uc.Chrome(**chrome_kwargs)
+        # uc.Chrome() patches chromedriver in a folder shared by every
+        # process, so concurrent starts (workers, other runs) delete each
+        # other's binary. Start one browser at a time.
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        startup_lock = _try_lock_file(CHROMEDRIVER_LOCK_FILE, blocking=True)
+        try:
+            self.driver = uc.Chrome(**chrome_kwargs)
+        finally:
+            if startup_lock is not None:
+                startup_lock.close()
         self.driver.set_page_load_timeout(self.timeout)
         self.driver.implicitly_wait(10)
         logger.info("Browser initialized")
 
+    def _acquire_profile(self):
+        """
+        Claim the first persistent profile slot not locked by another browser
+        (in this or another run), or fall back to a temp profile if all are busy.
+        The slot stays locked until close().
+        """
+        CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        for slot in range(MAX_CHROME_PROFILES):
+            lock = _try_lock_file(CHROME_PROFILE_DIR / f'profile-{slot}.lock')
+            if lock is not None:
+                self._profile_lock = lock
+                self.profile_dir = str(CHROME_PROFILE_DIR / f'profile-{slot}')
+                os.makedirs(self.profile_dir, exist_ok=True)
+                logger.debug(f"Using Chrome profile {self.profile_dir}")
+                return
+        logger.info("All persistent Chrome profiles are in use; using a temporary profile")
+        self._use_temp_profile()
+
+    def _use_temp_profile(self):
+        """Switch to a fresh throwaway profile, removing any previous one."""
+        self._remove_temp_profile()
+        self._temp_profile_dir = tempfile.mkdtemp(prefix='geotracker_profile_')
+        self.profile_dir = self._temp_profile_dir
+
+    def _remove_temp_profile(self):
+        if self._temp_profile_dir:
+            shutil.rmtree(self._temp_profile_dir, ignore_errors=True)
+            self._temp_profile_dir = None
+
+    def _disk_cache_dir(self):
+        """
+        Chrome's HTTP cache location: tmpfs (/dev/shm) when it has room,
+        otherwise the system temp dir. Temp profiles keep theirs inside the
+        profile so it is removed with it.
+        """
+        if self._temp_profile_dir:
+            return os.path.join(self._temp_profile_dir, 'disk_cache')
+        root = tempfile.gettempdir()
+        try:
+            if shutil.disk_usage('/dev/shm').free >= DISK_CACHE_SHM_HEADROOM * self.disk_cache_bytes:
+                root = '/dev/shm'
+        except OSError:
+            pass
+        return os.path.join(root, 'geotracker_cache', os.path.basename(self.profile_dir))
+
+    def _cloudflare_challenge_active(self):
+        """Return True while the current page is still a Cloudflare challenge."""
+        try:
+            return bool(self.driver.execute_script(self.CLOUDFLARE_PROBE_JS))
+        except Exception:
+            # Script failed mid-navigation (e.g. the challenge redirecting)
+            return True
+
     def _wait_for_cloudflare(self):
         """
         Navigate to homepage and wait for Cloudflare challenge to resolve.
@@ -180,29 +577,96 @@ class GeoTrackerDownloader:
         logger.info("Navigating to GeoTracker homepage to handle Cloudflare challenge...")
         self.driver.get(self.HOME_URL)
 
+        if self._cloudflare_challenge_active() and self._restore_cloudflare_cookies():
+            self.driver.get(self.HOME_URL)
+            if not self._cloudflare_challenge_active():
+                logger.info("Cloudflare challenge skipped using saved clearance cookies")
+                self._on_cloudflare_cleared()
+                return True
+
         max_wait = 30
-        poll_interval = 2
-        elapsed = 0
-
-        while elapsed < max_wait:
-            page_source = self.driver.page_source.lower()
-            cf_markers = [
-                'checking your browser',
-                'just a moment',
-                'cf-browser-verification',
-                'challenge-platform',
-            ]
-            if any(marker in page_source for marker in cf_markers):
-                logger.debug(f"Cloudflare challenge still active ({elapsed}s)...")
+        poll_interval = 1
+        start = time.time()
+
+        while time.time() - start < max_wait:
+            if self._cloudflare_challenge_active():
+                logger.debug(f"Cloudflare challenge still active ({time.time() - start:.0f}s)...")
                 time.sleep(poll_interval)
-                elapsed += poll_interval
             else:
-                logger.info(f"Cloudflare challenge resolved after {elapsed}s")
+                logger.info(f"Cloudflare challenge resolved after {time.time() - start:.0f}s")
+                self._on_cloudflare_cleared()
                 return True
 
         logger.warning("Cloudflare challenge may not have resolved within timeout")
         return False
 
+    def _on_cloudflare_cleared(self):
+        """Share fresh clearance cookies with other browsers and the HTTP session."""
+        self._save_cloudflare_cookies()
+        try:
+            self._sync_http_session()
+        except Exception as e:
+            logger.debug(f"Could not set up HTTP session: {e}")
+
+    def _save_cloudflare_cookies(self):
+        """
+        Persist the browser's Cloudflare cookies (cf_clearance, __cf_bm) so
+        later browsers, worker processes and recoveries can skip the
+        challenge. The site's own session cookies are left out so browsers
+        never share a server-side session.
+
+        saved_at is kept when cf_clearance is unchanged, so the age check
+        measures the clearance itself rather than the last save.
+        """
+        try:
+            cookies = [c for c in self.driver.get_cookies()
+                       if _is_cloudflare_cookie(c.get('name', ''))]
+            if not cookies:
+                return
+            saved_at = time.time()
+            previous = _load_cloudflare_cookies()
+            clearance = _cookie_value(cookies, 'cf_clearance')
+            if (previous and clearance is not None
+                    and clearance == _cookie_value(previous.get('cookies', []), 'cf_clearance')):
+                saved_at = previous.get('saved_at', saved_at)
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            payload = {'saved_at': saved_at, 'cookies': cookies}
+            # mkstemp gives an owner-only file; os.replace keeps concurrent
+            # writers from leaving a partial file behind
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, CLOUDFLARE_COOKIE_FILE)
+        except Exception as e:
+            logger.debug(f"Could not save Cloudflare cookies: {e}")
+
+    def _restore_cloudflare_cookies(self):
+        """
+        Add saved, still-fresh cookies to the browser. Must be called while on
+        a GeoTracker page. Returns True if any cookie was added.
+        """
+        payload = _load_cloudflare_cookies()
+        if payload is None:
+            return False
+
+        now = time.time()
+        if now - payload.get('saved_at', 0) > CLOUDFLARE_COOKIE_MAX_AGE:
+            return False
+
+        added = 0
+        for cookie in payload.get('cookies', []):
+            if not _is_cloudflare_cookie(cookie.get('name', '')):
+                continue
+            if cookie.get('expiry') and cookie['expiry'] <= now:
+                continue
+            try:
+                self.driver.add_cookie(cookie)
+                added += 1
+            except Exception:
+                # Cookies for other domains can't be set from this page
+                continue
+        return added > 0
+
     def _download_all_documents(self, global_id):
         """
         Navigate directly to the Site Maps / Documents download page,
@@ -214,11 +678,13 @@ class GeoTrackerDownloader:
 
         Returns (success, temp_dir, doc_count).
         """
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-
         site_temp_dir = tempfile.mkdtemp(prefix=f'gt_{global_id}_')
+        url = self.DOWNLOAD_URL.format(global_id)
+
+        # Cheap HTTP check first: skip the browser trip for sites with no documents
+        if self._http_page_lacks_documents(url, global_id):
+            logger.info(f"No 'SELECT ALL DOCUMENTS' link in page for {global_id} - skipping browser")
+            return False, site_temp_dir, 0
 
         # Set download directory for this site via CDP
         self.driver.execute_cdp_cmd('Page.setDownloadBehavior', {
@@ -227,94 +693,35 @@ class GeoTrackerDownloader:
         })
 
         # Navigate directly to the download page
-        url = self.DOWNLOAD_URL.format(global_id)
         logger.info(f"Navigating to {url}")
 
         try:
+            # get() returns after the load event; the waits below cover any
+            # content rendered after that.
             self.driver.get(url)
-            time.sleep(3)
         except Exception as e:
             logger.error(f"Failed to load page for {global_id}: {e}")
             return False, site_temp_dir, 0
 
         # Check if the page has documents (look for "SELECT ALL DOCUMENTS" link)
         # Step 1: Click "SELECT ALL DOCUMENTS"
-        select_clicked = False
-        try:
-            element = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.LINK_TEXT, "SELECT ALL DOCUMENTS"))
-            )
-            element.click()
-            time.sleep(2)
-            select_clicked = True
-            logger.info("Clicked 'SELECT ALL DOCUMENTS'")
-        except Exception:
-            pass
-
-        if not select_clicked:
-            # Try partial/alternate selectors
-            alt_selectors = [
-                (By.PARTIAL_LINK_TEXT, "SELECT ALL DOCUMENTS"),
-                (By.XPATH, "//a[contains(text(), 'SELECT ALL DOCUMENTS')]"),
-                (By.XPATH, "//*[contains(text(), 'SELECT ALL DOCUMENTS')]"),
-            ]
-            for by, selector in alt_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    time.sleep(2)
-                    select_clicked = True
-                    logger.info("Clicked 'SELECT ALL DOCUMENTS' (alt selector)")
-                    break
-                except Exception:
-                    continue
-
-        if not select_clicked:
+        # Allow the same 10s as before for a link rendered after page load
+        if not self._click_first_match(self.SELECT_ALL_XPATHS, timeout=10):
             logger.warning(f"No 'SELECT ALL DOCUMENTS' link found for {global_id} - site may have no documents")
             return False, site_temp_dir, 0
+        logger.info("Clicked 'SELECT ALL DOCUMENTS'")
+        self._wait_for_selection()
 
         # Step 2: Click "Download Selected Files" button
-        download_clicked = False
-        try:
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//input[@type='button' and @value='Download Selected Files']"))
-            )
-            element.click()
-            time.sleep(2)
-            download_clicked = True
-            logger.info("Clicked 'Download Selected Files'")
-        except Exception:
-            pass
-
-        if not download_clicked:
-            alt_selectors = [
-                (By.XPATH, "//input[contains(@value, 'Download Selected')]"),
-                (By.XPATH, "//button[contains(text(), 'Download Selected')]"),
-                (By.XPATH, "//*[contains(text(), 'Download Selected Files')]"),
-            ]
-            for by, selector in alt_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    time.sleep(2)
-                    download_clicked = True
-                    logger.info("Clicked 'Download Selected Files' (alt selector)")
-                    break
-                except Exception:
-                    continue
-
-        if not download_clicked:
+        existing = set(scan_download_dir(site_temp_dir)[0])
+        if not self._click_first_match(self.DOWNLOAD_SELECTED_XPATHS):
             logger.warning(f"Could not find 'Download Selected Files' button for {global_id}")
             return self._fallback_download_documents(global_id, site_temp_dir)
+        logger.info("Clicked 'Download Selected Files'")
 
-        # Wait for download to complete
-        success = self._wait_for_download(site_temp_dir, timeout=120)
-        files = [f for f in os.listdir(site_temp_dir) if not f.endswith('.crdownload')]
+        # Wait for download to start and complete
+        success = self._wait_for_download(site_temp_dir, existing, timeout=120)
+        files, _ = scan_download_dir(site_temp_dir)
         doc_count = len(files)
 
         if success and doc_count > 0:
@@ -324,6 +731,84 @@ class GeoTrackerDownloader:
             logger.warning(f"Download may have failed for {global_id} ({doc_count} files found)")
             return doc_count > 0, site_temp_dir, doc_count
 
+    def _http_page_lacks_documents(self, url, global_id):
+        """
+        Fetch the download page over self.http and report whether it
+        definitely has no 'SELECT ALL DOCUMENTS' link.
+
+        Returns False whenever the answer is uncertain (no session, request
+        error, non-200 or Cloudflare challenge response, a redirect away from
+        this site's profile report, or a page without the documents tab), so
+        the caller falls back to the browser. A missing link is also not
+        trusted until some earlier page's raw HTML has shown one, since the
+        link may be injected by script after load.
+        """
+        if self.http is None:
+            return False
+        try:
+            resp = self.http.get(url, timeout=(10, self.timeout))
+        except Exception as e:
+            logger.debug(f"HTTP pre-check failed for {url}: {e}")
+            return False
+        if resp.status_code != 200 or resp.headers.get('cf-mitigated') == 'challenge':
+            return False
+
+        # Only trust a missing link on the page we asked for, after redirects
+        final_url = urlparse(resp.url)
+        query = parse_qs(final_url.query)
+        if (not final_url.path.endswith('/profile_report')
+                or query.get('global_id') != [global_id]):
+            logger.debug(f"HTTP pre-check for {global_id} ended up at {resp.url}")
+            return False
+        html = resp.text
+        if global_id not in html or DOCUMENTS_TAB_PATTERN.search(html) is None:
+            logger.debug(f"HTTP pre-check for {global_id} did not get the documents tab")
+            return False
+
+        if SELECT_ALL_PATTERN.search(html) is not None:
+            if not self._http_precheck_trusted:
+                logger.debug("Server HTML includes the 'SELECT ALL DOCUMENTS' link; "
+                             "trusting the HTTP pre-check from now on")
+                self._http_precheck_trusted = True
+            return False
+        return self._http_precheck_trusted
+
+    def _click_first_match(self, xpaths, timeout=3):
+        """
+        Click the first element matching any of xpaths, in order of preference.
+
+        All candidates are probed in a single execute_script round-trip per
+        poll, instead of a separate WebDriverWait per selector, so a page that
+        lacks the element costs about timeout seconds rather than the sum of
+        every selector's wait. The default timeout suits controls that should
+        already be present; pass a longer one for content that may render late.
+        Returns True if something was clicked.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        try:
+            matched = WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda d: d.execute_script(self.CLICK_FIRST_MATCH_JS, xpaths))
+        except Exception:
+            return False
+        logger.debug(f"Clicked element matching {matched}")
+        return True
+
+    def _wait_for_selection(self, timeout=5):
+        """
+        Wait until 'SELECT ALL DOCUMENTS' has checked at least one document
+        checkbox. Gives up quietly after timeout seconds.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script(
+                    "return document.querySelectorAll('input[type=checkbox]:checked').length > 0")
+            )
+        except Exception:
+            logger.debug("No checked document checkboxes seen after 'SELECT ALL DOCUMENTS'")
+
     def _fallback_download_documents(self, global_id, site_temp_dir):
         """
         Fallback: discover individual document links and download them one by one.
@@ -385,13 +870,17 @@ class GeoTrackerDownloader:
 
         logger.info(f"Found {len(doc_links)} document links via fallback")
 
-        downloaded = 0
-        for i, url in enumerate(doc_links):
+        # Fetch directly over HTTP with the browser's Cloudflare clearance;
+        # anything that fails is retried through the browser below.
+        downloaded, failed_links = self._http_download_documents(doc_links, site_temp_dir)
+
+        for i, url in enumerate(failed_links):
             filename = url.split('/')[-1].split('?')[0] or f'document_{i}.pdf'
-            logger.info(f"  Downloading [{i+1}/{len(doc_links)}]: {filename}")
+            logger.info(f"  Downloading via browser [{i+1}/{len(failed_links)}]: {filename}")
             try:
+                existing = set(scan_download_dir(site_temp_dir)[0])
                 self.driver.get(url)
-                if self._wait_for_download(site_temp_dir, timeout=60):
+                if self._wait_for_download(site_temp_dir, existing, timeout=60):
                     downloaded += 1
                 time.sleep(max(1, self.delay / 2))
             except Exception as e:
@@ -399,18 +888,104 @@ class GeoTrackerDownloader:
 
         return downloaded > 0, site_temp_dir, downloaded
 
-    def _wait_for_download(self, download_dir, timeout=60):
+    def _sync_http_session(self):
+        """
+        Create or refresh self.http, a requests.Session that carries the
+        browser's cookies (including cf_clearance) and User-Agent, so plain
+        HTTP requests pass Cloudflare like the browser does.
+        """
+        import requests
+
+        if self.http is None:
+            self.http = requests.Session()
+        self.http.headers['User-Agent'] = self.driver.execute_script(
+            'return navigator.userAgent')
+        for cookie in self.driver.get_cookies():
+            self.http.cookies.set(cookie['name'], cookie['value'],
+                                  domain=cookie.get('domain', ''),
+                                  path=cookie.get('path', '/'))
+
+    def _http_download_documents(self, doc_links, site_temp_dir):
+        """
+        Download document URLs concurrently over self.http.
+        Returns (downloaded_count, failed_links).
+        """
+        try:
+            self._sync_http_session()
+        except Exception as e:
+            logger.warning(f"  Could not set up HTTP session, using browser: {e}")
+            return 0, list(doc_links)
+
+        # Pick unique filenames up front so concurrent downloads never collide
+        filenames = []
+        used = set()
+        for i, url in enumerate(doc_links):
+            filename = url.split('/')[-1].split('?')[0] or f'document_{i}.pdf'
+            if filename in used:
+                base, ext = os.path.splitext(filename)
+                filename = f'{base}_{i}{ext}'
+            used.add(filename)
+            filenames.append(filename)
+
+        downloaded = 0
+        failed_links = []
+        with ThreadPoolExecutor(max_workers=HTTP_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self._http_download_file, url,
+                                os.path.join(site_temp_dir, filename)): url
+                for url, filename in zip(doc_links, filenames)
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    filename = future.result()
+                    downloaded += 1
+                    logger.info(f"  Downloaded [{downloaded}/{len(doc_links)}]: {filename}")
+                except Exception as e:
+                    logger.debug(f"  HTTP download failed for {url}: {e}")
+                    failed_links.append(url)
+
+        if failed_links:
+            logger.info(f"  {len(failed_links)} document(s) failed over HTTP")
+        return downloaded, failed_links
+
+    def _http_download_file(self, url, dest):
+        """
+        Stream one document to the path dest. Returns its filename.
+        Raises on HTTP errors or when an HTML page (e.g. a Cloudflare
+        challenge) comes back instead of a document.
+        """
+        # Write under a .crdownload name so directory scans treat it as
+        # in progress until it is complete
+        partial = dest + '.crdownload'
+        try:
+            with self.http.get(url, stream=True, timeout=(10, self.timeout)) as resp:
+                resp.raise_for_status()
+                if 'text/html' in resp.headers.get('Content-Type', ''):
+                    raise ValueError("got an HTML page instead of a document")
+                with open(partial, 'wb') as f:
+                    for chunk in resp.iter_content(chunk_size=HTTP_CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(partial, dest)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        return os.path.basename(dest)
+
+    def _wait_for_download(self, download_dir, existing=(), timeout=60):
         """
         Wait for a download to complete by monitoring for .crdownload files.
+        Completed files named in existing don't count; callers snapshot the
+        directory before triggering the download, so a file that finishes
+        before this call still counts while files from earlier downloads
+        into the same directory do not.
         Returns True if a download completed within the timeout.
         """
         start = time.time()
-        # Give the download a moment to start
-        time.sleep(2)
 
         while time.time() - start < timeout:
-            in_progress = glob.glob(os.path.join(download_dir, '*.crdownload'))
-            files = [f for f in os.listdir(download_dir) if not f.endswith('.crdownload')]
+            completed, in_progress = scan_download_dir(download_dir)
+            files = [f for f in completed if f not in existing]
 
             if files and not in_progress:
                 return True
@@ -419,7 +994,7 @@ class GeoTrackerDownloader:
                 # No files appeared and nothing in progress after 10s
                 return False
 
-            time.sleep(1)
+            time.sleep(0.5)
 
         return False
 
@@ -428,11 +1003,8 @@ class GeoTrackerDownloader:
         Package all downloaded files into {GLOBAL_ID}.zip.
         Returns the zip path or None if no files.
         """
-        downloaded_files = []
-        for f in os.listdir(site_temp_dir):
-            fpath = os.path.join(site_temp_dir, f)
-            if os.path.isfile(fpath) and not f.endswith('.crdownload'):
-                downloaded_files.append(fpath)
+        completed, _ = scan_download_dir(site_temp_dir)
+        downloaded_files = [os.path.join(site_temp_dir, f) for f in completed]
 
         if not downloaded_files:
             logger.warning(f"No files to zip for {global_id}")
@@ -440,10 +1012,10 @@ class GeoTrackerDownloader:
 
         zip_path = self.output_dir / f"{global_id}.zip"
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
             for filepath in downloaded_files:
                 arcname = os.path.basename(filepath)
-                zf.write(filepath, arcname)
+                self._write_zip_entry(zf, filepath, arcname)
 
         # Clean up temp directory
         shutil.rmtree(site_temp_dir, ignore_errors=True)
@@ -452,21 +1024,69 @@ class GeoTrackerDownloader:
         logger.info(f"Created {zip_path.name} ({len(downloaded_files)} files, {zip_size_mb:.1f} MB)")
         return str(zip_path)
 
+    def _zip_compress_type(self, filename):
+        """Pick the zipfile compression method for one archive entry."""
+        if self.zip_compression == 'deflate':
+            return zipfile.ZIP_DEFLATED
+        if self.zip_compression == 'store':
+            return zipfile.ZIP_STORED
+        ext = os.path.splitext(filename)[1].lower()
+        return zipfile.ZIP_DEFLATED if ext in COMPRESSIBLE_EXTENSIONS else zipfile.ZIP_STORED
+
+    def _write_zip_entry(self, zf, filepath, arcname):
+        """
+        Copy one file into an open ZipFile using a large buffer, so big
+        payloads take a few hundred reads/writes rather than tens of thousands.
+        """
+        zinfo = zipfile.ZipInfo.from_file(filepath, arcname)
+        zinfo.compress_type = self._zip_compress_type(arcname)
+        with open(filepath, 'rb') as src, zf.open(zinfo, 'w') as dst:
+            shutil.copyfileobj(src, dst, ZIP_COPY_BUFSIZE)
+
     def _recover_driver(self):
         """Attempt to restart the browser after a crash."""
         logger.warning("Attempting browser recovery...")
-        try:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
-        except Exception:
-            self.driver = None
+        self._quit_driver()
 
         time.sleep(5)
+        # A hung browser may still hold its profile, so restart on a fresh one;
+        # the persistent slot stays locked until close()
+        self._use_temp_profile()
         self._init_driver()
         self._wait_for_cloudflare()
         logger.info("Browser recovery successful")
 
+    def _quit_driver(self):
+        """Quit the browser, ignoring errors from an already-dead session."""
+        try:
+            if self.driver:
+                self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+    def close(self):
+        """
+        Quit the browser, remove the base temp download directory and any temp
+        profile, and release the persistent profile slot.
+        """
+        self._quit_driver()
+        if self.base_temp_dir and os.path.exists(self.base_temp_dir):
+            shutil.rmtree(self.base_temp_dir, ignore_errors=True)
+        self._remove_temp_profile()
+        if self._profile_lock is not None:
+            self._profile_lock.close()
+            self._profile_lock = None
+        self.profile_dir = None
+
+    def _scan_existing_zips(self):
+        """Record the GLOBAL_IDs that already have a zip in output_dir (for --resume)."""
+        with os.scandir(self.output_dir) as entries:
+            self.existing_zips = {
+                entry.name[:-len('.zip')] for entry in entries
+                if entry.name.endswith('.zip') and entry.is_file()
+            }
+
     def process_site(self, site):
         """
         Process a single site: navigate to profile, find docs tab,
@@ -485,12 +1105,10 @@ class GeoTrackerDownloader:
         }
 
         # Resume: skip if zip already exists
-        if self.resume:
-            existing_zip = self.output_dir / f"{global_id}.zip"
-            if existing_zip.exists():
-                logger.info(f"Skipping {global_id} (zip already exists)")
-                result['status'] = 'skipped_existing'
-                return result
+        if self.resume and global_id in self.existing_zips:
+            logger.info(f"Skipping {global_id} (zip already exists)")
+            result['status'] = 'skipped_existing'
+            return result
 
         # Download all documents (navigates directly to download page)
         try:
@@ -521,7 +1139,11 @@ class GeoTrackerDownloader:
         return result
 
     def _write_summary_log(self):
-        """Write a JSON summary of the entire run."""
+        """
+        Write a JSON summary of the run so far. Called periodically while
+        sites are processed and once at the end; each call rewrites the same
+        file.
+        """
         summary = {
             'run_timestamp': datetime.now().isoformat(),
             'parameters': {
@@ -548,87 +1170,259 @@ class GeoTrackerDownloader:
             'sites': self.results,
         }
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_path = self.output_dir / f"download_log_{timestamp}.json"
-        with open(log_path, 'w') as f:
+        if self.log_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self.log_path = self.output_dir / f"download_log_{timestamp}.json"
+
+        # Write then rename so an interrupted write never leaves a truncated log
+        tmp_path = self.log_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(summary, f, indent=2)
+        os.replace(tmp_path, self.log_path)
+        self._last_summary_write = time.time()
+
+    @staticmethod
+    def _error_result(site, status, error):
+        """Result record for a site that could not be processed."""
+        return {
+            'global_id': site['global_id'],
+            'business_name': site['business_name'],
+            'distance_miles': site['distance_miles'],
+            'status': status,
+            'documents_found': 0,
+            'documents_downloaded': 0,
+            'zip_file': None,
+            'errors': [error],
+        }
+
+    def _process_site_safely(self, site):
+        """
+        Run process_site, converting unexpected errors into an error result
+        and restarting the browser after one.
+
+        Returns (result, browser_ok); browser_ok is False if recovery failed.
+        """
+        try:
+            return self.process_site(site), True
+        except Exception as e:
+            logger.error(f"Unexpected error processing {site['global_id']}: {e}")
+            result = self._error_result(site, 'unexpected_error', str(e))
+            # Try to recover the browser
+            try:
+                self._recover_driver()
+            except Exception as re:
+                logger.error(f"Browser recovery failed: {re}")
+                return result, False
+            return result, True
+
+    def _log_site_header(self, site, position=None):
+        """Log the banner shown before each site is processed."""
+        label = f"site {position}" if position else "site"
+        logger.info("")
+        logger.info("=" * 60)
+        logger.info(
+            f"Processing {label}: "
+            f"{site['global_id']} - {site['business_name']}")
+        logger.info(f"Distance: {site['distance_miles']} miles")
+        logger.info("=" * 60)
+
+    def _record_result(self, result, total):
+        """Store a site's result, log progress and checkpoint the summary log."""
+        self.results.append(result)
+        self._log_progress(total)
+        if time.time() - self._last_summary_write >= SUMMARY_WRITE_INTERVAL:
+            try:
+                self._write_summary_log()
+            except OSError as e:
+                logger.warning(f"Could not update summary log: {e}")
+
+    def _log_progress(self, total):
+        """Log a running tally of results so far."""
+        completed = sum(1 for r in self.results if r['status'] == 'completed')
+        no_docs = sum(1 for r in self.results if r['status'] == 'no_documents')
+        failed = sum(1 for r in self.results
+                     if 'failed' in r['status'] or 'error' in r['status'])
+        logger.info(
+            f"Progress: {len(self.results)}/{total} processed | "
+            f"{completed} downloaded | {no_docs} empty | {failed} failed")
+
+    def _worker_config(self):
+        """Constructor arguments for an equivalent downloader in a worker process."""
+        return {
+            'output_dir': str(self.output_dir),
+            'delay': self.delay,
+            'timeout': self.timeout,
+            'headless': self.headless,
+            'resume': self.resume,
+            'chrome_version': self.chrome_version,
+            'zip_compression': self.zip_compression,
+            'disk_cache_mb': self.disk_cache_mb,
+        }
+
+    def _run_sequential(self, sites):
+        """Process sites one at a time with this instance's browser."""
+        self._init_driver()
+
+        if not self._wait_for_cloudflare():
+            logger.error("Failed to bypass Cloudflare. Try running without --headless.")
+            return
 
-        logger.info(f"Summary log written to {log_path}")
+        for i, site in enumerate(sites):
+            self._log_site_header(site, f"{i+1}/{len(sites)}")
 
-    def run(self, sites):
-        """Process all filtered sites."""
+            result, browser_ok = self._process_site_safely(site)
+            self._record_result(result, len(sites))
+            if not browser_ok:
+                break
+
+            # Rate limiting between sites
+            if i < len(sites) - 1:
+                logger.info(f"Waiting {self.delay}s before next site...")
+                time.sleep(self.delay)
+
+    def _run_parallel(self, sites, workers):
+        """
+        Process sites across a pool of worker processes, each driving its own
+        browser. Selenium sessions are not thread-safe, hence processes.
+        Results stream back as each site finishes.
+
+        Like the sequential path, the run stops as soon as any worker's browser
+        becomes unusable or a worker process dies; sites not yet started are
+        left out of the results.
+        """
+        workers = min(workers, len(sites))
+        logger.info(f"Starting {workers} worker processes")
+
+        remaining = iter(sites)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._worker_config(),),
+        ) as executor:
+            # Keep one site per worker in flight so nothing new is started
+            # once the run has to stop
+            in_flight = {executor.submit(_process_site_in_worker, site)
+                         for site in itertools.islice(remaining, workers)}
+            stopping = False
+            try:
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            result, browser_ok = future.result()
+                        except BrokenProcessPool:
+                            if not stopping:
+                                logger.error("A worker process died unexpectedly. Stopping.")
+                                stopping = True
+                            continue
+                        self._record_result(result, len(sites))
+                        if not browser_ok and not stopping:
+                            logger.error("A worker's browser is unusable. Stopping after "
+                                         "sites already in progress finish.")
+                            stopping = True
+                    if not stopping:
+                        in_flight |= {executor.submit(_process_site_in_worker, site)
+                                      for site in itertools.islice(remaining, len(done))}
+            except BaseException:
+                logger.warning("Waiting for sites already in progress to finish...")
+                raise
+
+    def run(self, sites, workers=1):
+        """Process all filtered sites, in parallel when workers > 1."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Starting download for {len(sites)} sites")
         logger.info(f"Output directory: {self.output_dir.resolve()}")
 
-        self._init_driver()
+        if self.resume:
+            self._scan_existing_zips()
+            logger.info(f"Found {len(self.existing_zips)} existing zip(s) to skip")
 
         try:
-            if not self._wait_for_cloudflare():
-                logger.error("Failed to bypass Cloudflare. Try running without --headless.")
-                return
-
-            for i, site in enumerate(sites):
-                logger.info("")
-                logger.info("=" * 60)
-                logger.info(
-                    f"Processing site {i+1}/{len(sites)}: "
-                    f"{site['global_id']} - {site['business_name']}")
-                logger.info(f"Distance: {site['distance_miles']} miles")
-                logger.info("=" * 60)
-
-                try:
-                    result = self.process_site(site)
-                except Exception as e:
-                    logger.error(f"Unexpected error processing {site['global_id']}: {e}")
-                    result = {
-                        'global_id': site['global_id'],
-                        'business_name': site['business_name'],
-                        'distance_miles': site['distance_miles'],
-                        'status': 'unexpected_error',
-                        'documents_found': 0,
-                        'documents_downloaded': 0,
-                        'zip_file': None,
-                        'errors': [str(e)],
-                    }
-                    # Try to recover the browser
-                    try:
-                        self._recover_driver()
-                    except Exception as re:
-                        logger.error(f"Browser recovery failed: {re}")
-                        self.results.append(result)
-                        break
-
-                self.results.append(result)
-
-                # Progress summary
-                completed = sum(1 for r in self.results if r['status'] == 'completed')
-                no_docs = sum(1 for r in self.results if r['status'] == 'no_documents')
-                failed = sum(1 for r in self.results
-                             if 'failed' in r['status'] or 'error' in r['status'])
-                logger.info(
-                    f"Progress: {i+1}/{len(sites)} processed | "
-                    f"{completed} downloaded | {no_docs} empty | {failed} failed")
-
-                # Rate limiting between sites
-                if i < len(sites) - 1:
-                    logger.info(f"Waiting {self.delay}s before next site...")
-                    time.sleep(self.delay)
-
+            if workers > 1 and len(sites) > 1:
+                self._run_parallel(sites, workers)
+            else:
+                self._run_sequential(sites)
         except KeyboardInterrupt:
             logger.warning("\nInterrupted by user. Saving partial results...")
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.driver = None
-                except Exception:
-                    self.driver = None
+            self.close()
             self._write_summary_log()
-            # Clean up base temp dir
-            if self.base_temp_dir and os.path.exists(self.base_temp_dir):
-                shutil.rmtree(self.base_temp_dir, ignore_errors=True)
+            logger.info(f"Summary log written to {self.log_path}")
+
+
+# Per-process downloader used by the worker pool in GeoTrackerDownloader._run_parallel
+_worker_downloader = None
+_worker_sites_done = 0
+# Set once this worker's browser is unusable; see _process_site_in_worker
+_worker_browser_error = None
+
+
+def _init_worker(config):
+    """
+    Pool initializer: set up this worker's downloader. The browser itself is
+    started by the first task, so a failure there becomes a result the parent
+    can act on instead of a crash in the initializer.
+    """
+    global _worker_downloader
+
+    # The parent handles Ctrl-C and stops the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if not logger.handlers:
+        # Spawned (non-forked) workers start without the parent's logging setup
+        setup_logging()
+
+    _worker_downloader = GeoTrackerDownloader(**config)
+    if _worker_downloader.resume:
+        _worker_downloader._scan_existing_zips()
+    multiprocessing.util.Finalize(_worker_downloader, _worker_downloader.close,
+                                  exitpriority=10)
+
+
+def _start_worker_browser():
+    """
+    Start this worker's browser and clear Cloudflare.
+    Returns None on success or an error message if the browser is unusable.
+    """
+    try:
+        _worker_downloader._init_driver()
+    except Exception as e:
+        logger.error(f"Worker failed to start the browser: {e}")
+        return f"Browser failed to start: {e}"
+    if not _worker_downloader._wait_for_cloudflare():
+        logger.error("Worker failed to bypass Cloudflare. Try running without --headless.")
+        return "Failed to bypass Cloudflare"
+    return None
+
+
+def _process_site_in_worker(site):
+    """
+    Pool task: process one site with this worker's browser.
+    Returns (result, browser_ok), like _process_site_safely.
+
+    Once the browser is unusable (failed to start, Cloudflare not cleared, or
+    recovery failed) browser_ok is False and later tasks return a
+    'browser_failed' result without doing any work. The parent stops handing
+    out sites as soon as it sees browser_ok False.
+    """
+    global _worker_sites_done, _worker_browser_error
+
+    if _worker_browser_error is None and _worker_downloader.driver is None:
+        _worker_browser_error = _start_worker_browser()
+    if _worker_browser_error is not None:
+        return GeoTrackerDownloader._error_result(
+            site, 'browser_failed', _worker_browser_error), False
+
+    # Rate limiting applies per worker, between that worker's own sites
+    if _worker_sites_done:
+        time.sleep(_worker_downloader.delay)
+    _worker_sites_done += 1
+
+    _worker_downloader._log_site_header(site)
+    result, browser_ok = _worker_downloader._process_site_safely(site)
+    if not browser_ok:
+        _worker_browser_error = "Browser recovery failed"
+    return result, browser_ok
 
 
 def main():
@@ -640,6 +1434,7 @@ Examples:
   %(prog)s --lat 34.0522 --lon -118.2437 --radius 5
   %(prog)s --lat 37.7749 --lon -122.4194 --radius 10 --delay 8 --resume
   %(prog)s --lat 34.0522 --lon -118.2437 --radius 2 --max-sites 5
+  %(prog)s --lat 34.0522 --lon -118.2437 --radius 1 --workers 3
         """
     )
 
@@ -666,6 +1461,15 @@ Examples:
                         help='Skip sites that already have a zip in output-dir')
     parser.add_argument('--chrome-version', type=int, default=None,
                         help='Chrome major version number (auto-detected if omitted)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of parallel browser processes (default: 1)')
+    parser.add_argument('--zip-compression', choices=['auto', 'store', 'deflate'],
+                        default='auto',
+                        help='ZIP compression: auto deflates only text-like files and stores '
+                             'already-compressed ones such as PDFs (default: auto)')
+    parser.add_argument('--disk-cache-size', type=float, default=DEFAULT_DISK_CACHE_MB,
+                        help=f'Chrome HTTP disk cache cap per browser, in MB '
+                             f'(default: {DEFAULT_DISK_CACHE_MB})')
 
     args = parser.parse_args()
 
@@ -676,16 +1480,21 @@ Examples:
         parser.error("Longitude must be between -180 and 180")
     if args.radius <= 0:
         parser.error("Radius must be positive")
+    if args.workers < 1:
+        parser.error("Workers must be at least 1")
+    if args.disk_cache_size <= 0:
+        parser.error("Disk cache size must be positive")
 
     setup_logging()
 
     # Step 1: Parse sites
     logger.info(f"Reading sites from {args.sites_file}...")
-    sites = parse_sites_file(args.sites_file)
+    global_ids, business_names, lats, lons = parse_sites_file(args.sites_file)
 
     # Step 2: Filter by radius
     logger.info(f"Filtering sites within {args.radius} miles of ({args.lat}, {args.lon})...")
-    nearby_sites = filter_sites_by_radius(sites, args.lat, args.lon, args.radius)
+    nearby_sites = filter_sites_by_radius(global_ids, business_names, lats, lons,
+                                          args.lat, args.lon, args.radius)
 
     if not nearby_sites:
         logger.info("No sites found within the specified radius. Exiting.")
@@ -716,13 +1525,15 @@ Examples:
         headless=args.headless,
         resume=args.resume,
         chrome_version=args.chrome_version,
+        zip_compression=args.zip_compression,
+        disk_cache_mb=args.disk_cache_size,
     )
     downloader.center_lat = args.lat
     downloader.center_lon = args.lon
     downloader.radius_miles = args.radius
     downloader.total_sites = len(nearby_sites)
 
-    downloader.run(nearby_sites)
+    downloader.run(nearby_sites, workers=args.workers)
 
 
 if __name__ == '__main__':